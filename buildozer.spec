@@ -26,7 +26,7 @@ source.include_exts = py,png,jpg,atlas
 version = 0.1
 
 # (list) متطلبات التطبيق (هذا الجزء هو الأهم وتم تعديله بالكامل)
-requirements = python3,kivy==2.2.1,plyer,Pillow,pandas,google-generativeai,openpyxl,PyMuPDF
+requirements = python3,kivy==2.2.1,plyer,Pillow,pandas,google-generativeai,openpyxl,xlsxwriter,PyMuPDF
 
 # (str) صورة شاشة البداية (Presplash)
 # تأكد من وجود هذا الملف في المسار الصحيح: ./images/presplash.png
@@ -1,15 +1,23 @@
 #!/usr/bin/env python3
+import io
+import csv
 import os
 import re
 import sys
 import time
+import random
 import json
+import multiprocessing
 import glob
 import shutil
+import tempfile
 from pathlib import Path
 from typing import Optional, List
 import threading
-from functools import partial
+from functools import partial, lru_cache
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait as wait_futures
+from concurrent.futures.process import BrokenProcessPool
 
 # -- Kivy Imports --
 from kivy.app import App
@@ -44,7 +52,7 @@ except ImportError:
 
 # -- Project Imports for Core Logic --
 from PIL import Image, ImageOps, ImageEnhance
-from pdf2image import convert_from_path
+import fitz  # PyMuPDF
 import pandas as pd
 import google.generativeai as genai
 
@@ -65,6 +73,7 @@ KV_STRING = """
     CheckBox:
         id: checkbox
         size_hint_x: 0.15
+        on_active: root.on_checkbox_active(self.active)
 
     Label:
         text: root.file_name
@@ -206,6 +215,11 @@ KV_STRING = """
 
 """
 
+@lru_cache(maxsize=None)
+def load_kv():
+    # Parse KV_STRING only once per process, even if build() runs again
+    return Builder.load_string(KV_STRING)
+
 # ======================================================
 # CONSTANTS
 # ======================================================
@@ -213,18 +227,99 @@ MODEL_NAME = "gemini-1.5-pro"
 RATE_LIMIT_SLEEP = 3
 MAX_RETRIES = 3
 BACKOFF_FACTOR = 1.5
+MAX_RETRY_SLEEP = 60
 DPI = 300
+MAX_IMAGE_DIM = 1600
+JPEG_QUALITY = 85
+MAX_CONCURRENT_REQUESTS = 4
+MAX_CONCURRENT_FILES = 4
+RENDER_CHUNK_PAGES = 4
+RENDER_POLL_INTERVAL = 0.2
 APP_INPUT_FOLDER_NAME = "PDF_to_Excel_Input"
 CHECKPOINT_FILE = "checkpoint.json"
+LOG_FLUSH_INTERVAL = 0.2
+MAX_LOG_LINES = 500
 
 # ======================================================
 # Core Logic (Modified for progress reporting)
 # ======================================================
+# PyMuPDF does not support use from several threads at once, so in-process renders take turns
+render_lock = threading.Lock()
+
+def render_page(page) -> Optional[str]:
+    # Render one page to a temporary JPEG; returns None for blank pages
+    # Clamp the long side to MAX_IMAGE_DIM pixels to keep uploads small
+    long_side = max(page.rect.width, page.rect.height)
+    dpi = min(DPI, int(MAX_IMAGE_DIM * 72 / long_side))
+    pix = page.get_pixmap(dpi=dpi)
+    # Blank pages carry no table data, so don't spend an upload on them
+    if pix.is_unicolor:
+        return None
+    # Encode before creating the temp file so a failed encode leaves nothing behind
+    jpeg_bytes = pix.tobytes("jpeg", jpg_quality=JPEG_QUALITY)
+    tmp = tempfile.NamedTemporaryFile(suffix='.jpg', delete=False)
+    try:
+        with tmp:
+            tmp.write(jpeg_bytes)
+    except Exception:
+        os.remove(tmp.name)
+        raise
+    return tmp.name
+
+
+def render_pdf_pages(pdf_path: str, start: int, stop: int) -> List[str]:
+    # Module-level so it can run in a worker process, giving each render its own MuPDF instance
+    image_paths = []
+    try:
+        # One Document for the whole chunk, so fonts and resources are parsed once per chunk
+        with fitz.open(pdf_path) as doc:
+            for i in range(start, stop):
+                image_path = render_page(doc.load_page(i))
+                if image_path:
+                    image_paths.append(image_path)
+    except Exception:
+        for image_path in image_paths:
+            os.remove(image_path)
+        raise
+    return image_paths
+
+
+def discard_rendered_pages(future):
+    # Done-callback for render chunks that will never be uploaded
+    if not future.cancelled() and future.exception() is None:
+        for image_path in future.result():
+            os.remove(image_path)
+
+
+def dedupe_header(header: List[str]) -> List[str]:
+    # Rename repeated column names to 'a', 'a.1', 'a.2', ... the same way pd.read_csv does
+    counts = {}
+    columns = []
+    for column in header:
+        count = counts.get(column, 0)
+        while count > 0:
+            counts[column] = count + 1
+            column = f"{column}.{count}"
+            count = counts.get(column, 0)
+        columns.append(column)
+        counts[column] = count + 1
+    return columns
+
+
 class CoreProcessor:
     def __init__(self, app_instance):
         self.app = app_instance
         self.client = None
         self.running = False
+        self.csv_texts = {}
+        self.completed_files = 0
+        self.upload_executor = None
+        self.render_executor = None
+        self.render_executor_lock = threading.Lock()
+        # Mobile Python has no working multiprocessing, so only desktop renders in worker processes
+        self.use_render_processes = platform not in ('android', 'ios')
+        # Caps every API call in flight (uploads, deletes and generate_content) across all file threads
+        self.api_semaphore = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
 
     def log(self, msg: str):
         self.app.update_log(msg)
@@ -232,24 +327,131 @@ class CoreProcessor:
     def update_progress(self, percent, message):
         self.app.update_progress(percent, message)
 
+    def overall_progress(self, total_files: int) -> float:
+        # Files finish out of order, so progress is based on how many have completed
+        return self.completed_files / total_files * 100
+
+    def get_render_executor(self) -> ProcessPoolExecutor:
+        # Created once and reused across runs, since every spawned worker re-imports this module
+        with self.render_executor_lock:
+            if self.render_executor is None:
+                # Spawn rather than fork: this runs inside a multithreaded Kivy process
+                self.render_executor = ProcessPoolExecutor(max_workers=MAX_CONCURRENT_FILES,
+                                                           mp_context=multiprocessing.get_context('spawn'))
+            return self.render_executor
+
+    def reset_render_executor(self, broken: ProcessPoolExecutor):
+        # A crashed worker breaks the whole pool; replace it so the remaining files can still render
+        with self.render_executor_lock:
+            if self.render_executor is broken:
+                self.render_executor = None
+        broken.shutdown(wait=False)
+
+    def shutdown_render_executor(self):
+        with self.render_executor_lock:
+            executor, self.render_executor = self.render_executor, None
+        if executor:
+            executor.shutdown()
+
+    def wait_while_running(self, future) -> bool:
+        # Returns False if a stop was requested before the future finished
+        while not future.done():
+            if not self.running:
+                return False
+            wait_futures([future], timeout=RENDER_POLL_INTERVAL)
+        return True
+
+    def render_pages(self, pdf_path: str):
+        # Yields each rendered page as soon as it is available, so its upload can start straight away
+        if not self.use_render_processes:
+            with render_lock, fitz.open(pdf_path) as doc:
+                for i in range(len(doc)):
+                    if not self.running: return
+                    image_path = render_page(doc.load_page(i))
+                    if image_path:
+                        yield image_path
+            return
+
+        with render_lock, fitz.open(pdf_path) as doc:
+            page_count = len(doc)
+        executor = self.get_render_executor()
+        futures = []
+        consumed = 0
+        try:
+            # Chunks of pages render in parallel workers and are handed back in page order
+            for start in range(0, page_count, RENDER_CHUNK_PAGES):
+                stop = min(start + RENDER_CHUNK_PAGES, page_count)
+                futures.append(executor.submit(render_pdf_pages, pdf_path, start, stop))
+            for future in futures:
+                if not self.wait_while_running(future):
+                    return
+                chunk = future.result()
+                consumed += 1
+                yield from chunk
+        except BrokenProcessPool:
+            self.reset_render_executor(executor)
+            raise
+        finally:
+            for future in futures[consumed:]:
+                future.cancel()
+                future.add_done_callback(discard_rendered_pages)
+
     def retry_loop(self, func, *args, **kwargs):
         retries = 0
         sleep_time = RATE_LIMIT_SLEEP
         while retries < MAX_RETRIES:
             try:
-                return func(*args, **kwargs)
+                with self.api_semaphore:
+                    return func(*args, **kwargs)
             except Exception as e:
                 if "RATE_LIMIT_EXCEEDED" in str(e) or "429" in str(e):
                     retries += 1
-                    self.log(f"Rate limit hit. Retrying in {sleep_time:.1f}s... (Attempt {retries}/{MAX_RETRIES})")
-                    time.sleep(sleep_time)
-                    sleep_time *= BACKOFF_FACTOR
+                    # Prefer the server's Retry-After hint, and add jitter so parallel uploads don't retry in lockstep
+                    wait = self.get_retry_after(e) or sleep_time
+                    wait = min(wait, MAX_RETRY_SLEEP) + random.random()
+                    self.log(f"Rate limit hit. Retrying in {wait:.1f}s... (Attempt {retries}/{MAX_RETRIES})")
+                    time.sleep(wait)
+                    sleep_time = min(sleep_time * BACKOFF_FACTOR, MAX_RETRY_SLEEP)
                 else:
                     self.log(f"[ERROR] An unexpected error occurred: {e}")
                     raise  # Re-raise other errors
         self.log("Max retries exceeded for rate limiting. Aborting.")
         return None
 
+    def get_retry_after(self, error) -> Optional[float]:
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None) or {}
+        try:
+            return float(headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            return None
+
+    def upload_image(self, image_path: str):
+        try:
+            # Skip pending uploads once the user has requested a stop
+            if not self.running:
+                return None
+            return self.retry_loop(partial(genai.upload_file, path=image_path))
+        finally:
+            # The rendered page is only needed until it has been uploaded
+            os.remove(image_path)
+
+    def collect_uploads(self, upload_futures) -> list:
+        # Failed uploads come back as None; retry_loop has already logged the reason
+        uploaded_files = []
+        for future in upload_futures:
+            try:
+                uploaded_files.append(future.result())
+            except Exception:
+                uploaded_files.append(None)
+        return uploaded_files
+
+    def delete_uploads(self, uploaded_files):
+        # Deletion failures are non-fatal, so don't wait on them before moving on
+        for up_file in uploaded_files:
+            if up_file:
+                self.upload_executor.submit(self.retry_loop, genai.delete_file, name=up_file.name)
+
     def init_genai_client(self, api_key):
         try:
             genai.configure(api_key=api_key)
@@ -262,27 +464,46 @@ class CoreProcessor:
             return False
 
     def process_single_pdf(self, pdf_path: str, file_index: int, total_files: int):
+        if not self.running:
+            return
         base_filename = Path(pdf_path).stem
-        output_folder = self.app.get_input_folder_path()
-        image_folder = os.path.join(output_folder, f"{base_filename}_images")
-        os.makedirs(image_folder, exist_ok=True)
-        
-        file_progress_start = (file_index - 1) / total_files * 100
         
-        # 1. Convert PDF to Images
+        # 1. Convert PDF to images
         self.log(f"({file_index}/{total_files}) Converting {base_filename}.pdf to images...")
-        self.update_progress(file_progress_start, f"Processing {base_filename}...")
+        self.update_progress(self.overall_progress(total_files), f"Processing {base_filename}...")
+        image_paths = []
+        upload_futures = []
         try:
-            images = convert_from_path(pdf_path, dpi=DPI, output_folder=image_folder, fmt='jpeg', thread_count=2)
-            image_paths = [img.filename for img in images]
+            # Upload each page as soon as it is rendered
+            for image_path in self.render_pages(pdf_path):
+                image_paths.append(image_path)
+                upload_futures.append(self.upload_executor.submit(self.upload_image, image_path))
         except Exception as e:
             self.log(f"[ERROR] Could not convert PDF {pdf_path}: {e}")
+            # Pages rendered before the error may already be uploaded
+            self.delete_uploads(self.collect_uploads(upload_futures))
+            return
+
+        if not image_paths:
+            # An early stop also leaves no pages, but that isn't worth reporting as blank
+            if not self.running: return
+            self.log(f"No non-blank pages found in {base_filename}.pdf. Skipping.")
+            return
+
+        self.log(f"Converted {len(image_paths)} pages of {base_filename}.pdf to images.")
+        self.log(f"Sending images of {base_filename}.pdf to AI for data extraction...")
+        uploaded_files = self.collect_uploads(upload_futures)
+
+        if not self.running:
+            self.delete_uploads(uploaded_files)
             return
-            
-        self.log(f"Converted {len(image_paths)} pages to images.")
+
+        if not all(uploaded_files):
+             self.log(f"File uploading for {base_filename}.pdf failed after multiple retries.")
+             self.delete_uploads(uploaded_files)
+             return
 
         # 2. Process with AI
-        self.log("Sending images to AI for data extraction...")
         prompt = """
         Analyze the following images which are pages from a single document.
         Extract all tabular data into a single, clean, comma-separated CSV format.
@@ -292,101 +513,110 @@ class CoreProcessor:
         - Only output the raw CSV data.
         - Ensure all values are properly quoted if they contain commas.
         """
-        uploaded_files = [self.retry_loop(partial(genai.upload_file, path=p)) for p in image_paths if self.running]
-        
-        if not all(uploaded_files):
-             self.log("File uploading failed after multiple retries.")
-             return
-
-        if not self.running: return
-
-        self.update_progress(file_progress_start + 20, f"Extracting data from {base_filename}...")
+        self.update_progress(self.overall_progress(total_files), f"Extracting data from {base_filename}...")
         response = self.retry_loop(self.client.generate_content, [prompt] + uploaded_files)
         
-        for up_file in uploaded_files:
-            self.retry_loop(genai.delete_file, name=up_file.name)
+        self.delete_uploads(uploaded_files)
 
         if not response or not hasattr(response, 'text'):
             self.log(f"[ERROR] Failed to get a valid response from AI for {pdf_path}.")
             return
         
-        # 3. Save CSV
-        csv_data = response.text.strip()
-        csv_output_path = os.path.join(output_folder, f"{base_filename}.csv")
-        try:
-            with open(csv_output_path, 'w', encoding='utf-8') as f:
-                f.write(csv_data)
-            self.log(f"Successfully saved data to {base_filename}.csv")
-        except Exception as e:
-            self.log(f"[ERROR] Failed to save CSV file {csv_output_path}: {e}")
-            
-        # 4. Cleanup
-        shutil.rmtree(image_folder)
-        self.update_progress(file_index / total_files * 100, f"Completed {base_filename}")
+        # 3. Keep CSV in memory for the combine step
+        self.csv_texts[base_filename] = response.text.strip()
+        self.log(f"Successfully extracted data from {base_filename}.pdf")
 
-    def combine_csv_files(self):
+    def combine_csv_files(self, csv_texts: dict):
         output_folder = self.app.get_input_folder_path()
-        csv_files = glob.glob(os.path.join(output_folder, "*.csv"))
-        if not csv_files:
-            self.log("No CSV files were generated to combine.")
+        if not csv_texts:
+            self.log("No CSV data was generated to combine.")
             return
 
-        combined_df = pd.DataFrame()
-        for f in csv_files:
+        # Parse with the csv module and build a single DataFrame at the end
+        all_rows = []
+        for name, text in csv_texts.items():
             try:
-                df = pd.read_csv(f)
-                combined_df = pd.concat([combined_df, df], ignore_index=True)
-            except Exception as e:
-                self.log(f"Could not read or process {os.path.basename(f)}: {e}")
+                reader = csv.reader(io.StringIO(text))
+                header = next(reader, None)
+                if not header:
+                    continue
+                columns = dedupe_header(header)
+                rows = []
+                for values in reader:
+                    # Skip blank lines, and reject rows wider than the header as read_csv did
+                    if not values:
+                        continue
+                    if len(values) > len(columns):
+                        raise csv.Error(f"line {reader.line_num} has more fields than the header")
+                    rows.append({k: v or None for k, v in zip(columns, values)})
+                all_rows.extend(rows)
+            except csv.Error as e:
+                self.log(f"Could not read or process data from {name}.pdf: {e}")
+
+        combined_df = pd.DataFrame(all_rows)
+        # csv yields strings, so restore numeric columns as read_csv would have
+        for column in combined_df.columns:
+            try:
+                combined_df[column] = pd.to_numeric(combined_df[column])
+            except (ValueError, TypeError):
+                pass
 
         if not combined_df.empty:
             final_output_path = os.path.join(output_folder, "combined_output.xlsx")
-            combined_df.to_excel(final_output_path, index=False)
+            combined_df.to_excel(final_output_path, index=False, engine='xlsxwriter')
             self.log(f"Successfully combined all data into 'combined_output.xlsx'")
 
-    def cleanup_temp_files(self):
-        output_folder = self.app.get_input_folder_path()
-        csv_files = glob.glob(os.path.join(output_folder, "*.csv"))
-        for f in csv_files:
-            try:
-                os.remove(f)
-            except OSError as e:
-                self.log(f"Error removing temporary file {f}: {e}")
-        self.log("Cleaned up intermediate CSV files.")
-
     def run_processing(self, file_list: List[str]):
         self.running = True
+        self.csv_texts = {}
         self.app.set_processing_state(True)
-        
-        if platform == 'android':
-            self.app.start_foreground_notification()
-        
-        api_key = self.app.store.get('user_settings')['api_key']
-        if not self.init_genai_client(api_key):
-            self.app.set_processing_state(False)
-            return
-
-        total_files = len(file_list)
-        for i, file_path in enumerate(file_list):
-            if not self.running:
-                self.log("Processing stopped by user.")
-                break
+        # Always reset the UI and executors, even if setting up or tearing down the pools fails
+        try:
+            if platform == 'android':
+                self.app.start_foreground_notification()
             
-            self.process_single_pdf(file_path, i + 1, total_files)
-
-        if self.running:
-            self.log("All files processed. Combining results...")
-            self.combine_csv_files()
-            self.cleanup_temp_files()
-            self.log("All tasks finished successfully.")
-            self.update_progress(100, "Completed!")
-        else:
-             self.update_progress(0, "Stopped")
-
-        self.app.set_processing_state(False)
-        if platform == 'android':
-            self.app.stop_foreground_notification()
-        self.running = False
+            api_key = self.app.store.get('user_settings')['api_key']
+            if not self.init_genai_client(api_key):
+                return
+
+            total_files = len(file_list)
+            self.completed_files = 0
+            # Uploads and deletes from all files share one pool, sized to the same cap as
+            # retry_loop's semaphore so MAX_CONCURRENT_REQUESTS is the only knob for API concurrency
+            self.upload_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+            with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_FILES, total_files)) as ex:
+                futures = {ex.submit(self.process_single_pdf, file_path, i + 1, total_files): file_path
+                           for i, file_path in enumerate(file_list)}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        self.log(f"[ERROR] Failed to process {futures[future]}: {e}")
+                    self.completed_files += 1
+                    self.update_progress(self.overall_progress(total_files), f"Completed {Path(futures[future]).stem}")
+
+            if self.running:
+                self.log("All files processed. Combining results...")
+                self.combine_csv_files(self.csv_texts)
+                self.log("All tasks finished successfully.")
+                self.update_progress(100, "Completed!")
+            else:
+                 self.log("Processing stopped by user.")
+                 self.update_progress(0, "Stopped")
+        except Exception as e:
+            self.log(f"[ERROR] Processing failed: {e}")
+            self.update_progress(0, "Failed")
+        finally:
+            try:
+                if self.upload_executor:
+                    # Waits for any pending deletions
+                    self.upload_executor.shutdown()
+            finally:
+                self.upload_executor = None
+                self.app.set_processing_state(False)
+                if platform == 'android':
+                    self.app.stop_foreground_notification()
+                self.running = False
 
 
 # ======================================================
@@ -397,6 +627,14 @@ class ListItemWithCheckbox(BoxLayout):
     file_path = StringProperty('')
     file_name = StringProperty('')
 
+    def on_checkbox_active(self, active):
+        # Keep the app's selection in sync so start_processing needn't scan the list
+        selected_paths = App.get_running_app().selected_paths
+        if active:
+            selected_paths.add(self.file_path)
+        else:
+            selected_paths.discard(self.file_path)
+
 class FileBrowserScreen(Screen):
     def on_enter(self, *args):
         # Automatically refresh file list when screen is shown
@@ -404,6 +642,7 @@ class FileBrowserScreen(Screen):
 
     def refresh_file_list(self):
         self.ids.file_list_grid.clear_widgets()
+        App.get_running_app().selected_paths.clear()
         input_folder = App.get_running_app().get_input_folder_path()
         pdf_files = glob.glob(os.path.join(input_folder, "*.pdf"))
         
@@ -434,16 +673,13 @@ class FileBrowserScreen(Screen):
         self.refresh_file_list()
 
     def start_processing(self):
-        selected_files = []
-        for item in self.ids.file_list_grid.children:
-            if isinstance(item, ListItemWithCheckbox) and item.ids.checkbox.active:
-                selected_files.append(item.file_path)
+        app = App.get_running_app()
+        selected_files = sorted(app.selected_paths)
 
         if not selected_files:
             self.ids.status_label.text = "No files selected. Please check at least one file."
             return
 
-        app = App.get_running_app()
         app.selected_files_to_process = selected_files
         app.root.current = 'processing'
 
@@ -452,8 +688,18 @@ class ProcessingScreen(Screen):
     progress_value = NumericProperty(0)
     progress_message = StringProperty("Waiting to start")
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Only the most recent lines are kept so each update re-renders a bounded label
+        self.log_lines = deque(maxlen=MAX_LOG_LINES)
+
+    def append_log(self, messages: List[str]):
+        self.log_lines.extend(messages)
+        self.log_text = "\n".join(self.log_lines) + "\n"
+
     def on_enter(self, *args):
-        self.log_text = "Preparing to process files...\n"
+        self.log_lines.clear()
+        self.append_log(["Preparing to process files..."])
         self.progress_value = 0
         self.progress_message = "Starting..."
         app = App.get_running_app()
@@ -489,16 +735,21 @@ class SettingsScreen(Screen):
 class PDFtoExcelApp(App):
     processing = BooleanProperty(False)
     selected_files_to_process = ListProperty([])
+    _download_folder = None
+    _input_folder = None
 
     def build(self):
         # Load the KV string definition
-        Builder.load_string(KV_STRING)
+        load_kv()
 
         self.store = JsonStore('settings.json')
         if not self.store.exists('user_settings'):
             self.store.put('user_settings', api_key='')
 
         self.processor = CoreProcessor(self)
+        self.selected_paths = set()
+        self.log_buffer = deque()
+        self.log_flush_event = None
 
         self.sm = ScreenManager()
         self.file_browser_screen = FileBrowserScreen(name='file_browser')
@@ -511,6 +762,10 @@ class PDFtoExcelApp(App):
         
         return self.sm
 
+    def on_stop(self):
+        # The render pool outlives individual runs, so close it with the app
+        self.processor.shutdown_render_executor()
+
     def on_start(self):
         self.get_input_folder_path() # Ensure folder exists
         if platform == 'android':
@@ -520,9 +775,20 @@ class PDFtoExcelApp(App):
         if not self.store.get('user_settings').get('api_key'):
             self.root.current = 'settings'
 
-    @mainthread
     def update_log(self, message):
-        self.processing_screen.log_text += f"{message}\n"
+        # Buffered here and flushed in batches by flush_log on the main thread
+        self.log_buffer.append(message)
+        # The flush interval only runs during processing, so flush messages logged outside a run now
+        if not self.processing:
+            Clock.schedule_once(self.flush_log)
+
+    def flush_log(self, dt):
+        if not self.log_buffer:
+            return
+        messages = []
+        while self.log_buffer:
+            messages.append(self.log_buffer.popleft())
+        self.processing_screen.append_log(messages)
         # Optional: Auto-scroll the log view
         self.processing_screen.ids.log_label.parent.scroll_y = 0
     
@@ -536,6 +802,13 @@ class PDFtoExcelApp(App):
     @mainthread
     def set_processing_state(self, is_processing):
         self.processing = is_processing
+        # Only poll the log buffer while a run is active
+        if is_processing and self.log_flush_event is None:
+            self.log_flush_event = Clock.schedule_interval(self.flush_log, LOG_FLUSH_INTERVAL)
+        elif not is_processing and self.log_flush_event is not None:
+            self.log_flush_event.cancel()
+            self.log_flush_event = None
+            self.flush_log(0)
 
     def request_android_permissions(self):
         try:
@@ -544,18 +817,23 @@ class PDFtoExcelApp(App):
             self.update_log(f"Permission request failed: {e}")
         
     def get_download_folder_path(self):
-        if platform == 'android':
-            from android.storage import primary_external_storage_path
-            return os.path.join(primary_external_storage_path(), 'Download')
-        else:
-            return str(Path.home() / "Downloads")
+        if self._download_folder is None:
+            if platform == 'android':
+                from android.storage import primary_external_storage_path
+                self._download_folder = os.path.join(primary_external_storage_path(), 'Download')
+            else:
+                self._download_folder = str(Path.home() / "Downloads")
+        return self._download_folder
     
     def get_input_folder_path(self):
-        download_folder = self.get_download_folder_path()
-        input_folder = os.path.join(download_folder, APP_INPUT_FOLDER_NAME)
-        if not os.path.exists(input_folder):
-            os.makedirs(input_folder)
-        return input_folder
+        # Resolved and created once, then reused by every caller
+        if self._input_folder is None:
+            download_folder = self.get_download_folder_path()
+            input_folder = os.path.join(download_folder, APP_INPUT_FOLDER_NAME)
+            if not os.path.exists(input_folder):
+                os.makedirs(input_folder)
+            self._input_folder = input_folder
+        return self._input_folder
 
     def start_foreground_notification(self):
         if platform == 'android':